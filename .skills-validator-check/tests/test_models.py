@@ -176,6 +176,20 @@ class TestValidationResult:
         result.add_issue(issue)
         assert len(result.issues) == 1
 
+    def test_add_issues_preserves_order(self):
+        """Test adding several issues at once keeps their order."""
+        result = ValidationResult(
+            file_path=Path("test.md"),
+            component_type="skill"
+        )
+        issues = [
+            ValidationIssue(severity=Severity.ERROR, file_path=Path("test.md"), message="first"),
+            ValidationIssue(severity=Severity.WARNING, file_path=Path("test.md"), message="second"),
+        ]
+        result.add_issues(issues)
+        assert [i.message for i in result.issues] == ["first", "second"]
+        assert result.has_errors and result.has_warnings
+
     def test_add_error_convenience(self):
         """Test add_error convenience method."""
         result = ValidationResult(
@@ -1,5 +1,6 @@
 """Tests for validator classes."""
 
+import json
 import pytest
 import sys
 from pathlib import Path
@@ -19,6 +20,8 @@ from validators.validators import (
     KebabCaseValidator,
     SkillPackageValidator,
     PluginVersionValidator,
+    PluginJsonValidator,
+    _SectionRules,
 )
 from validators.models import Severity
 
@@ -48,6 +51,24 @@ class TestSkillValidator:
         assert result.is_valid, f"Errors: {[str(e) for e in result.errors]}"
         assert len(result.errors) == 0
 
+    def test_missing_recommended_sections_reported_in_stable_order(self, validator, temp_skill_file):
+        """Test recommended-section warnings use display names in a deterministic order."""
+        content = """---
+name: test-skill
+description: Does something. Use when testing.
+allowed-tools: Read
+---
+
+# Test Skill
+"""
+        result = validator.validate(temp_skill_file(content))
+
+        recommended = [w.message for w in result.warnings if "recommended section" in w.message]
+        assert recommended == [
+            "Missing recommended section: '## Best Practices'",
+            "Missing recommended section: '## Constraints and Warnings'",
+        ]
+
     def test_missing_name_fails(self, validator, temp_skill_file):
         """Test missing name field is reported as error."""
         content = """---
@@ -943,6 +964,48 @@ ok
                        if "Non-standard file at skill root" in i.message]
         assert len(file_errors) == 2
 
+    def test_prohibited_files_fail(self, validator, temp_skill_file, valid_skill_content):
+        """Test that README.md and CHANGELOG.md in a skill folder are prohibited."""
+        skill_file = temp_skill_file(valid_skill_content)
+        skill_dir = skill_file.parent
+        (skill_dir / "README.md").write_text("# Readme")
+        (skill_dir / "CHANGELOG.md").write_text("# Changes")
+
+        result = validator.validate(skill_file)
+        prohibited = [i.message for i in result.errors if "Prohibited file" in i.message]
+        assert prohibited == [
+            "Prohibited file found: CHANGELOG.md",
+            "Prohibited file found: README.md",
+        ]
+
+    def test_dangling_symlink_is_not_prohibited(self, validator, temp_skill_file, valid_skill_content):
+        """Test that a broken README.md symlink does not count as an existing file."""
+        skill_file = temp_skill_file(valid_skill_content)
+        (skill_file.parent / "README.md").symlink_to(skill_file.parent / "missing.md")
+
+        result = validator.validate(skill_file)
+        assert not any("Prohibited file" in i.message for i in result.errors)
+
+    def test_revalidation_sees_edited_file(self, validator, temp_skill_file, valid_skill_content):
+        """Test that an edited file is re-read rather than served from cache."""
+        skill_file = temp_skill_file(valid_skill_content)
+        assert validator.validate(skill_file).is_valid
+
+        skill_file.write_text("# No frontmatter anymore\n")
+        result = validator.validate(skill_file)
+        assert any("Missing YAML frontmatter" in e.message for e in result.errors)
+
+    def test_validate_many_preserves_order(self, validator, temp_skill_file, valid_skill_content, tmp_path):
+        """Test threaded batch validation returns results in input order."""
+        skill_file = temp_skill_file(valid_skill_content)
+        missing = tmp_path / "skills" / "missing" / "SKILL.md"
+
+        results = validator.validate_many([skill_file, missing, skill_file], max_workers=2)
+
+        assert [r.file_path for r in results] == [skill_file, missing, skill_file]
+        assert results[0].is_valid and results[2].is_valid
+        assert not results[1].is_valid
+
     def test_hidden_files_are_allowed(self, validator, temp_skill_file, valid_skill_content):
         """Test that hidden files like .gitkeep are accepted."""
         skill_file = temp_skill_file(valid_skill_content)
@@ -1285,6 +1348,31 @@ Examples content.
         assert len(order_errors) > 0, "Expected section order error but found none"
 
 
+class TestSectionRules:
+    """Tests for single-pass section detection."""
+
+    def test_reports_missing_required_and_recommended(self):
+        """Test missing sections are split into required and recommended."""
+        rules = _SectionRules({"overview": r"^#{1,3}\s+Overview"}, frozenset({"best_practices"}))
+        assert rules.missing("## Overview\n") == ([], ["Best Practices"])
+        assert rules.missing("## Other\n") == (["Overview"], ["Best Practices"])
+
+    def test_overlapping_headings_are_all_found(self):
+        """Test a heading matched by an earlier branch still satisfies later ones."""
+        rules = _SectionRules(
+            {"usage": r"^#{1,3}\s+Usage", "usage_notes": r"^#{1,3}\s+Usage\s+Notes"},
+            frozenset()
+        )
+        assert rules.missing("## Usage Notes\n") == ([], [])
+
+    def test_scan_starts_at_offset(self):
+        """Test headings before the given offset are ignored."""
+        rules = _SectionRules({"overview": r"^#{1,3}\s+Overview"}, frozenset())
+        text = "## Overview\n---\n## Other\n"
+        assert rules.missing(text) == ([], [])
+        assert rules.missing(text, text.index("## Other")) == (["Overview"], [])
+
+
 class TestValidatorFactory:
     """Tests for ValidatorFactory."""
 
@@ -1318,6 +1406,54 @@ class TestValidatorFactory:
         patterns = ValidatorFactory.get_all_patterns()
         assert len(patterns) == 9  # Skill, SkillMarkdown, Agent, Command, Rule, Hook, KebabCase, SkillPackage, PluginVersion
 
+    def test_matches_any_agrees_with_individual_patterns(self):
+        """Test the combined pre-filter matches exactly when some pattern matches."""
+        patterns = ValidatorFactory.get_all_patterns()
+        for path in ["skills/a/SKILL.md", "hooks/hooks.json", "a.skill", "scripts/run.py", "notes.txt"]:
+            expected = any(pattern.search(path) for pattern in patterns)
+            assert ValidatorFactory.matches_any(path) == expected
+
+    def test_validators_are_reused_per_configuration(self):
+        """Test factory reuses validator instances instead of rebuilding them per file."""
+        first = ValidatorFactory.get_validator(Path("skills/test/SKILL.md"))
+        second = ValidatorFactory.get_validator(Path("skills/other/SKILL.md"))
+        external = ValidatorFactory.get_validator(
+            Path("skills/test/SKILL.md"), validate_external_urls=True
+        )
+        assert first is second
+        assert external is not first
+        assert external.validate_external_urls
+
+    def test_validate_many_preserves_order(self, temp_skill_file, valid_skill_content, tmp_path):
+        """Test bulk validation returns one result per path, in input order."""
+        skill_file = temp_skill_file(valid_skill_content)
+        other = tmp_path / "notes.txt"
+        other.write_text("not a component")
+
+        results = ValidatorFactory.validate_many([skill_file, other, skill_file], workers=2)
+
+        assert [r.file_path if r else None for r in results] == [skill_file, None, skill_file]
+        assert results[0].is_valid
+
+    def test_non_candidate_suffix_is_rejected(self):
+        """Test files with extensions no validator accepts are rejected."""
+        for path in ["skills/test/scripts/run.py", "agents/notes.txt", "skills/test/SKILL.md.bak"]:
+            assert ValidatorFactory.get_validator(Path(path)) is None
+            assert not ValidatorFactory.matches_any(path)
+        for path in ["skills/test/SKILL.md", "hooks/hooks.json", "dist/test.skill"]:
+            assert ValidatorFactory.get_validator(Path(path)) is not None
+            assert ValidatorFactory.matches_any(path)
+
+    def test_repeated_lookups_return_same_validator(self):
+        """Test repeated and equivalent paths resolve to the same validator."""
+        path = Path("plugins/p/agents/cached-agent.md")
+        first = ValidatorFactory.get_validator(path)
+        assert isinstance(first, AgentValidator)
+        assert ValidatorFactory.get_validator(path) is first
+        assert ValidatorFactory.get_validator(Path("plugins/p/agents/./cached-agent.md")) is first
+        for _ in range(2):
+            assert ValidatorFactory.get_validator(Path("plugins/p/scripts/run.py")) is None
+
 
 class TestPluginVersionValidator:
     """Tests for PluginVersionValidator."""
@@ -1398,6 +1534,82 @@ class TestPluginVersionValidator:
         assert any("Cannot read version from plugin.json" in i.message for i in result.issues)
 
 
+class TestPluginJsonValidator:
+    """Tests for PluginJsonValidator component registration checks."""
+
+    @pytest.fixture
+    def validator(self):
+        return PluginJsonValidator()
+
+    @pytest.fixture
+    def temp_plugin(self, tmp_path: Path):
+        """Create a plugin directory with one skill, one agent and one command."""
+        def _create(registered: dict) -> Path:
+            plugin_root = tmp_path / "plugins" / "test-plugin"
+            (plugin_root / ".claude-plugin").mkdir(parents=True)
+            (plugin_root / "skills" / "my-skill").mkdir(parents=True)
+            (plugin_root / "skills" / "my-skill" / "SKILL.md").write_text("---\nname: my-skill\n---\n")
+            (plugin_root / "skills" / "not-a-skill").mkdir()
+            (plugin_root / "agents").mkdir()
+            (plugin_root / "agents" / "my-agent.md").write_text("agent")
+            (plugin_root / "agents" / "notes.txt").write_text("ignored")
+            (plugin_root / "commands").mkdir()
+            (plugin_root / "commands" / "my-command.md").write_text("command")
+
+            plugin_file = plugin_root / ".claude-plugin" / "plugin.json"
+            plugin_file.write_text(json.dumps({"name": "test-plugin", **registered}))
+            return plugin_file
+        return _create
+
+    def test_all_components_registered_passes(self, validator, temp_plugin):
+        """Test that a plugin registering every on-disk component has no registration errors."""
+        plugin_file = temp_plugin({
+            "skills": ["./skills/my-skill"],
+            "agents": ["./agents/my-agent.md"],
+            "commands": ["./commands/my-command.md"],
+        })
+        result = validator.validate(plugin_file)
+        assert result.is_valid
+
+    def test_unregistered_components_fail(self, validator, temp_plugin):
+        """Test that components on disk but missing from plugin.json are reported."""
+        plugin_file = temp_plugin({})
+        result = validator.validate(plugin_file)
+        messages = [i.message for i in result.errors]
+        assert "Unregistered skill: 'my-skill'" in messages
+        assert "Unregistered agent: 'my-agent.md'" in messages
+        assert "Unregistered command: 'my-command.md'" in messages
+        assert not any("not-a-skill" in m or "notes.txt" in m for m in messages)
+
+    def test_missing_registered_components_fail(self, validator, temp_plugin):
+        """Test that registered components missing from disk are reported."""
+        plugin_file = temp_plugin({
+            "skills": ["./skills/my-skill", "./skills/ghost-skill"],
+            "agents": ["./agents/my-agent.md", "./agents/ghost-agent.md"],
+            "commands": ["./commands/my-command.md"],
+        })
+        result = validator.validate(plugin_file)
+        messages = [i.message for i in result.errors]
+        assert messages == [
+            "Skill not found: './skills/ghost-skill'",
+            "Agent not found: './agents/ghost-agent.md'",
+        ]
+
+    def test_nested_component_paths_resolve(self, validator, temp_plugin):
+        """Test that components registered below a category directory are found."""
+        plugin_file = temp_plugin({
+            "skills": ["./skills/my-skill", "./skills/category/nested-skill"],
+            "agents": ["./agents/my-agent.md"],
+            "commands": ["./commands/my-command.md"],
+        })
+        nested = plugin_file.parent.parent / "skills" / "category" / "nested-skill"
+        nested.mkdir(parents=True)
+        (nested / "SKILL.md").write_text("---\nname: nested-skill\n---\n")
+
+        result = validator.validate(plugin_file)
+        assert not any("not found" in i.message for i in result.errors)
+
+
 class TestEmptyFolderValidator:
     """Tests for empty folder validation in SkillValidator."""
 
@@ -106,6 +106,9 @@ VALID_TOOLS: FrozenSet[str] = frozenset({
     "Skill",
 })
 
+# Short listing used in "unknown tool" suggestions
+VALID_TOOLS_PREVIEW = ", ".join(sorted(VALID_TOOLS)[:5])
+
 # =============================================================================
 # Valid Model Values (for Skills/Commands - includes inherit)
 # =============================================================================
@@ -117,6 +120,8 @@ VALID_MODELS: FrozenSet[str] = frozenset({
     "inherit",
 })
 
+VALID_MODELS_DISPLAY = ", ".join(sorted(VALID_MODELS))
+
 # =============================================================================
 # Valid Model Values for Agents (strict - no inherit, warning if used)
 # =============================================================================
@@ -127,6 +132,8 @@ AGENT_VALID_MODELS: FrozenSet[str] = frozenset({
     "haiku",
 })
 
+AGENT_VALID_MODELS_DISPLAY = ", ".join(sorted(AGENT_VALID_MODELS))
+
 # =============================================================================
 # Reserved Words (cannot be used as component names)
 # =============================================================================
@@ -141,6 +148,9 @@ RESERVED_WORDS: FrozenSet[str] = frozenset({
     "test", "debug", "run", "build", "deploy",
 })
 
+# Short listing used in "reserved name" suggestions
+RESERVED_WORDS_PREVIEW = ", ".join(sorted(RESERVED_WORDS)[:5])
+
 # =============================================================================
 # Prohibited Files in Skill Directories
 # =============================================================================
@@ -192,6 +202,8 @@ SKILL_ALLOWED_SUBDIRS: FrozenSet[str] = frozenset({
     "assets",
 })
 
+SKILL_ALLOWED_SUBDIRS_DISPLAY = ", ".join(sorted(SKILL_ALLOWED_SUBDIRS))
+
 # =============================================================================
 # Prohibited Fields in Skill Frontmatter
 # =============================================================================
@@ -393,6 +405,8 @@ VALID_LICENSES: FrozenSet[str] = frozenset({
     "EPL-2.0",
 })
 
+VALID_LICENSES_PREVIEW = ", ".join(sorted(VALID_LICENSES)[:5])
+
 # Plugin name pattern (kebab-case, no spaces)
 PLUGIN_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*$")
 
@@ -429,6 +443,8 @@ VALID_HOOK_EVENTS: FrozenSet[str] = frozenset({
     "WorktreeRemove",
 })
 
+VALID_HOOK_EVENTS_DISPLAY = ", ".join(sorted(VALID_HOOK_EVENTS))
+
 # Valid hook entry types
 VALID_HOOK_TYPES: FrozenSet[str] = frozenset({
     "command",
@@ -436,3 +452,5 @@ VALID_HOOK_TYPES: FrozenSet[str] = frozenset({
     "prompt",
     "agent",
 })
+
+VALID_HOOK_TYPES_DISPLAY = ", ".join(sorted(VALID_HOOK_TYPES))
@@ -5,7 +5,7 @@ Data models for validation results.
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 
 class Severity(Enum):
@@ -67,6 +67,10 @@ class ValidationResult:
         """Add an issue to the result."""
         self.issues.append(issue)
 
+    def add_issues(self, issues: Iterable[ValidationIssue]) -> None:
+        """Add several issues to the result at once."""
+        self.issues.extend(issues)
+
     def add_error(
         self,
         message: str,
@@ -3,11 +3,15 @@ Validation logic for Claude Code components.
 """
 
 import json
+import os
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from http.client import InvalidURL
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote, unquote, urlsplit, urlunsplit
 from urllib.request import Request, urlopen
@@ -30,6 +34,7 @@ from .config import (
     RULE_SCHEMA,
     SKILL_PROHIBITED_FILES,
     SKILL_ALLOWED_SUBDIRS,
+    SKILL_ALLOWED_SUBDIRS_DISPLAY,
     SKILL_REQUIRED_SECTIONS,
     SKILL_RECOMMENDED_SECTIONS,
     COMMAND_REQUIRED_SECTIONS,
@@ -41,9 +46,13 @@ from .config import (
     RULE_REQUIRED_SECTIONS,
     RULE_RECOMMENDED_SECTIONS,
     VALID_TOOLS,
+    VALID_TOOLS_PREVIEW,
     VALID_MODELS,
+    VALID_MODELS_DISPLAY,
     AGENT_VALID_MODELS,
+    AGENT_VALID_MODELS_DISPLAY,
     RESERVED_WORDS,
+    RESERVED_WORDS_PREVIEW,
     KEBAB_CASE_PATTERN,
     KEBAB_CASE_EXEMPT_FILES,
     SEMVER_PATTERN,
@@ -59,11 +68,182 @@ from .config import (
     WHEN_KEYWORDS,
     PLUGIN_JSON_SCHEMA,
     VALID_LICENSES,
+    VALID_LICENSES_PREVIEW,
     PLUGIN_NAME_PATTERN,
     VALID_HOOK_EVENTS,
+    VALID_HOOK_EVENTS_DISPLAY,
     VALID_HOOK_TYPES,
+    VALID_HOOK_TYPES_DISPLAY,
 )
-from .models import ValidationResult, Severity
+from .models import ValidationIssue, ValidationResult, Severity
+
+# Prefer the libyaml-backed loader; fall back to pure Python when unavailable
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Fixed patterns used on every validated file, compiled once at import
+_FRONTMATTER_END_PATTERN = re.compile(r"\n---\s*\n")
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_FENCE_PATTERN = re.compile(r"^\s{0,3}([`~]{3,})(.*)$")
+_INLINE_CODE_PATTERN = re.compile(r"(`+)([^`]*?)\1")
+_NON_NEWLINE_PATTERN = re.compile(r"[^\n]")
+_MALFORMED_HEADING_PATTERN = re.compile(r"^\s{0,3}#{1,6}(?!#)\S")
+_LINK_TARGET_PATTERN = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
+_AT_REFERENCE_PATTERN = re.compile(r"(?<![A-Za-z0-9_.+-])@((?:references|assets|scripts)/[^\s`)>]+)")
+_SUSPICIOUS_AT_PATTERN = re.compile(r"(?<![A-Za-z0-9_.+-])@([A-Za-z][A-Za-z0-9_]*)")
+_YAML_PAREN_KEY_PATTERN = re.compile(r"\([^)]+\):")
+_YAML_NUMBERED_PAREN_PATTERN = re.compile(r"\([0-9]+\)")
+_EXAMPLES_HEADER_PATTERN = re.compile(r"^#{1,3}\s+Examples", re.IGNORECASE | re.MULTILINE)
+_IO_SUBSECTION_PATTERN = re.compile(
+    r"^#{2,3}\s+(?:Input|Output|Example\s+\d+|Example:)",
+    re.MULTILINE | re.IGNORECASE
+)
+_CODE_BLOCK_PATTERN = re.compile(r"```[a-zA-Z0-9]*\n[\s\S]*?\n```", re.MULTILINE)
+_FILE_REFERENCE_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)', re.MULTILINE)
+_BARE_PATH_PATTERN = re.compile(
+    r'^(?:[\s]*[-*]?[\s]*)?(?:See|Run|Use|Check|Load|Read|Execute)?[\s:]*'
+    r'(scripts/|references/|assets/)(\S+)',
+    re.MULTILINE | re.IGNORECASE
+)
+# Base name of each comma-separated tool entry: "Read, Bash(git:*)" -> Read, Bash
+_TOOL_NAME_PATTERN = re.compile(r"(?:^|,)\s*([^,(\s][^,(]*?)\s*(?=\(|,|$)")
+_WHAT_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, sorted(WHAT_KEYWORDS))))
+_WHEN_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, sorted(WHEN_KEYWORDS))))
+_CAMEL_CASE_BOUNDARY_PATTERN = re.compile(r'([a-z])([A-Z])')
+_HYPHEN_RUN_PATTERN = re.compile(r'-+')
+
+# Suggestions that depend only on configuration, built once and shared by
+# every ValidationResult instead of re-formatted per issue
+_SUG_SHORTEN_NAME = f"Shorten name to {MAX_NAME_LENGTH} characters or less"
+_SUG_RESERVED_NAME = f"Choose a different name (reserved: {RESERVED_WORDS_PREVIEW}...)"
+_SUG_SHORTEN_DESCRIPTION = f"Shorten description to {MAX_DESCRIPTION_LENGTH} characters"
+_SUG_SHORTEN_COMPATIBILITY = f"Shorten compatibility to {MAX_COMPATIBILITY_LENGTH} characters or less"
+_SUG_VALID_TOOLS = f"Valid tools: {VALID_TOOLS_PREVIEW}..."
+_SUG_VALID_MODELS = f"Use one of: {VALID_MODELS_DISPLAY}"
+_SUG_ALLOWED_SUBDIRS = f"Move contents to one of the allowed subdirectories: {SKILL_ALLOWED_SUBDIRS_DISPLAY}/"
+_SUG_AGENT_MODELS = f"Use one of: {AGENT_VALID_MODELS_DISPLAY}"
+_SUG_AGENT_EXPLICIT_MODEL = f"Explicitly specify model for better control: {AGENT_VALID_MODELS_DISPLAY}"
+_SUG_PLUGIN_SHORTEN_NAME = f"Shorten 'name' to {MAX_NAME_LENGTH} characters or less"
+_SUG_PLUGIN_SHORTEN_DESCRIPTION = f"Shorten 'description' to {MAX_DESCRIPTION_LENGTH} characters or less"
+_SUG_PLUGIN_LONGER_DESCRIPTION = f"Provide a more detailed description (at least {MIN_DESCRIPTION_LENGTH} characters)"
+_SUG_LICENSE = f"Use a standard SPDX license identifier: {VALID_LICENSES_PREVIEW}..."
+_SUG_HOOK_EVENTS = f"Valid events: {VALID_HOOK_EVENTS_DISPLAY}"
+_SUG_HOOK_TYPE_MISSING = f'Add "type" field with one of: {VALID_HOOK_TYPES_DISPLAY}'
+_SUG_HOOK_TYPE_SET = f'Set "type" to one of: {VALID_HOOK_TYPES_DISPLAY}'
+_SUG_HOOK_TYPE_VALID = f'Valid types are: {VALID_HOOK_TYPES_DISPLAY}'
+
+# Command section-order check: one alternation with a group per section key,
+# so a body is scanned once. Every pattern is "^#{1,3}\s+<Title>" with distinct
+# titles, so no two can match at or across the same heading.
+_COMMAND_ORDER_INDEX: Dict[str, int] = {
+    key: COMMAND_SECTIONS_ORDER.index(key) for key in COMMAND_SECTION_PATTERNS
+}
+_COMMAND_ORDER_SCANNER = re.compile(
+    "|".join(f"(?P<{key}>{pattern})" for key, pattern in COMMAND_SECTION_PATTERNS.items()),
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Section display names that str.title() would get wrong
+_SECTION_DISPLAY_NAMES = {
+    "when_to_use": "When to Use",
+    "constraints_and_warnings": "Constraints and Warnings",
+}
+
+
+def _section_display_name(section_key: str) -> str:
+    """Return the '## Heading' text for a section key such as 'best_practices'."""
+    return _SECTION_DISPLAY_NAMES.get(section_key) or section_key.replace("_", " ").title()
+
+
+def _compile_recommended_sections(section_keys: Iterable[str]) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Build (display name, heading pattern) pairs for recommended sections, sorted by key."""
+    names = [_section_display_name(key) for key in sorted(section_keys)]
+    return tuple(
+        (name, re.compile(rf"^#{{1,3}}\s+{name}", re.IGNORECASE | re.MULTILINE))
+        for name in names
+    )
+
+
+def _read_component(path: Path) -> str:
+    """Return the UTF-8 text of a component file.
+
+    The bytes are decoded in one step; line endings are normalized only when
+    a carriage return is present, matching text-mode reads.
+    """
+    with open(path, "rb") as handle:
+        content = handle.read().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@lru_cache(maxsize=1024)
+def _load_yaml(yaml_content: str) -> Any:
+    """Parse a frontmatter block, memoized on its text.
+
+    The parsed value is shared between callers and must not be mutated.
+    Parse errors are not cached and propagate as yaml.YAMLError.
+    """
+    return yaml.load(yaml_content, Loader=_YAML_LOADER)
+
+
+@lru_cache(maxsize=16)
+def _body_start(content: str) -> Optional[Tuple[int, int]]:
+    """Return the index where the markdown body starts and its line offset.
+
+    Several checks ask for the body of the same file, so the result is
+    memoized; str caches its own hash, making repeat lookups O(1). Regex
+    checks scan ``content`` from this index instead of slicing out a copy.
+    Returns None when there is no closing frontmatter delimiter.
+    """
+    match = _FRONTMATTER_END_PATTERN.search(content)
+    if not match:
+        return None
+    return match.end(), content.count("\n", 0, match.end())
+
+
+class _SectionRules:
+    """Required and recommended section headings for one component type.
+
+    All headings are combined into one alternation so a body is scanned once.
+    A heading consumed by an earlier branch hides later branches at the same
+    position, so sections the combined scan misses are re-checked on their own
+    before being reported; that keeps results identical to per-section search.
+    """
+
+    def __init__(self, required: Dict[str, str], recommended: Iterable[str]) -> None:
+        self.required = tuple(
+            (_section_display_name(key), re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+            for key, pattern in required.items()
+        )
+        self.recommended = _compile_recommended_sections(recommended)
+        self._sections = self.required + self.recommended
+        branches = [
+            f"(?P<s{index}>{pattern.pattern})" for index, (_, pattern) in enumerate(self._sections)
+        ]
+        self._scanner = re.compile("|".join(branches), re.IGNORECASE | re.MULTILINE)
+
+    def missing(self, text: str, pos: int = 0) -> Tuple[List[str], List[str]]:
+        """Return display names of the missing (required, recommended) sections.
+
+        Only ``text[pos:]`` is examined; ``pos`` must sit at the start of a line.
+        """
+        found = {match.lastgroup for match in self._scanner.finditer(text, pos)}
+        absent = [
+            index
+            for index, (_, pattern) in enumerate(self._sections)
+            if f"s{index}" not in found and not pattern.search(text, pos)
+        ]
+        split = len(self.required)
+        return (
+            [self._sections[index][0] for index in absent if index < split],
+            [self._sections[index][0] for index in absent if index >= split],
+        )
+
+
+_SKILL_SECTIONS = _SectionRules(SKILL_REQUIRED_SECTIONS, SKILL_RECOMMENDED_SECTIONS)
+_AGENT_SECTIONS = _SectionRules(AGENT_REQUIRED_SECTIONS, AGENT_RECOMMENDED_SECTIONS)
+_COMMAND_SECTIONS = _SectionRules(COMMAND_REQUIRED_SECTIONS, COMMAND_RECOMMENDED_SECTIONS)
+_RULE_SECTIONS = _SectionRules(RULE_REQUIRED_SECTIONS, RULE_RECOMMENDED_SECTIONS)
 
 
 class BaseValidator(ABC):
@@ -71,6 +251,11 @@ class BaseValidator(ABC):
 
     _external_url_cache: Dict[str, Tuple[str, Optional[str]]] = {}
 
+    # Section headings checked by _validate_markdown_structure(), if any
+    SECTION_RULES: Optional[_SectionRules] = None
+    REQUIRED_SECTION_MESSAGE = "Missing required section: '## {0}'"
+    REQUIRED_SECTION_SUGGESTION = "Add '## {0}' section"
+
     def __init__(self, validate_external_urls: bool = False):
         self.validate_external_urls = validate_external_urls
 
@@ -92,16 +277,50 @@ class BaseValidator(ABC):
         """Return the validation schema with required/optional fields."""
         pass
 
-    def can_validate(self, file_path: Path) -> bool:
-        """Check if this validator can handle the given file."""
-        return bool(self.file_pattern.search(str(file_path)))
+    def can_validate(self, file_path: Path, path_str: Optional[str] = None) -> bool:
+        """Check if this validator can handle the given file.
+
+        Callers that already hold ``str(file_path)`` can pass it as ``path_str``
+        to avoid rebuilding it for every validator tried.
+        """
+        return bool(self.file_pattern.search(path_str or str(file_path)))
 
     def _extract_body(self, content: str) -> Tuple[str, int]:
         """Return markdown body after frontmatter and the starting line number offset."""
-        match = re.search(r"\n---\s*\n", content)
-        if not match:
+        start = _body_start(content)
+        if start is None:
             return content, 0
-        return content[match.end():], content[:match.end()].count("\n")
+        return content[start[0]:], start[1]
+
+    def _validate_markdown_structure(
+        self,
+        content: str,
+        result: ValidationResult
+    ) -> None:
+        """Validate required and recommended markdown sections are present."""
+        if self.SECTION_RULES is None:
+            return
+
+        # Find content after frontmatter
+        start = _body_start(content)
+        if start is None:
+            return  # Already caught by frontmatter validation
+
+        missing_required, missing_recommended = self.SECTION_RULES.missing(content, start[0])
+
+        # Check required sections
+        for section_name in missing_required:
+            result.add_error(
+                message=self.REQUIRED_SECTION_MESSAGE.format(section_name),
+                suggestion=self.REQUIRED_SECTION_SUGGESTION.format(section_name)
+            )
+
+        # Check recommended sections
+        for section_name in missing_recommended:
+            result.add_warning(
+                message=f"Missing recommended section: '## {section_name}'",
+                suggestion=f"Consider adding '## {section_name}' section"
+            )
 
     def _find_skill_root(self, file_path: Path) -> Path:
         """Resolve the skill root directory for SKILL.md and bundled resources."""
@@ -115,7 +334,7 @@ class BaseValidator(ABC):
 
     def _count_tokens(self, content: str) -> int:
         """Approximate token count using word/punctuation chunks."""
-        return len(re.findall(r"\w+|[^\w\s]", content, re.UNICODE))
+        return len(_TOKEN_PATTERN.findall(content))
 
     def _mask_code_regions(self, content: str) -> str:
         """Mask fenced and inline code while preserving string length and line numbers."""
@@ -125,17 +344,15 @@ class BaseValidator(ABC):
         fence_char = ""
         fence_length = 0
 
-        inline_code_pattern = re.compile(r"(`+)([^`]*?)\1")
-
         for line in lines:
-            fence_match = re.match(r"^\s{0,3}([`~]{3,})(.*)$", line)
+            fence_match = _FENCE_PATTERN.match(line)
 
             if in_fence:
                 if fence_match:
                     fence = fence_match.group(1)
                     if fence[0] == fence_char and len(fence) >= fence_length:
                         in_fence = False
-                masked_lines.append(re.sub(r"[^\n]", " ", line))
+                masked_lines.append(_NON_NEWLINE_PATTERN.sub(" ", line))
                 continue
 
             if fence_match:
@@ -143,11 +360,11 @@ class BaseValidator(ABC):
                 in_fence = True
                 fence_char = fence[0]
                 fence_length = len(fence)
-                masked_lines.append(re.sub(r"[^\n]", " ", line))
+                masked_lines.append(_NON_NEWLINE_PATTERN.sub(" ", line))
                 continue
 
             masked_lines.append(
-                inline_code_pattern.sub(
+                _INLINE_CODE_PATTERN.sub(
                     lambda match: " " * len(match.group(0)),
                     line,
                 )
@@ -175,7 +392,7 @@ class BaseValidator(ABC):
         fence_line = 0
 
         for idx, line in enumerate(lines, start=1):
-            fence_match = re.match(r"^\s{0,3}([`~]{3,})(.*)$", line)
+            fence_match = _FENCE_PATTERN.match(line)
 
             if in_fence:
                 if fence_match:
@@ -192,7 +409,7 @@ class BaseValidator(ABC):
                 fence_line = idx
                 continue
 
-            if re.match(r"^\s{0,3}#{1,6}(?!#)\S", line):
+            if _MALFORMED_HEADING_PATTERN.match(line):
                 result.add_error(
                     message="Malformed heading: missing space after '#' markers",
                     line_number=line_offset + idx,
@@ -395,17 +612,13 @@ class BaseValidator(ABC):
         masked = self._mask_code_regions(text)
         skill_root = self._find_skill_root(file_path)
 
-        md_link_pattern = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
-        at_reference_pattern = re.compile(r"(?<![A-Za-z0-9_.+-])@((?:references|assets|scripts)/[^\s`)>]+)")
-        suspicious_at_pattern = re.compile(r"(?<![A-Za-z0-9_.+-])@([A-Za-z][A-Za-z0-9_]*)")
-
         consumed_at_indices: Set[int] = set()
 
-        for match in md_link_pattern.finditer(masked):
+        for match in _LINK_TARGET_PATTERN.finditer(masked):
             line_number = self._issue_line_number(masked, match.start(), line_offset)
             self._validate_link_target(file_path, match.group(1), result, line_number)
 
-        for match in at_reference_pattern.finditer(masked):
+        for match in _AT_REFERENCE_PATTERN.finditer(masked):
             line_number = self._issue_line_number(masked, match.start(), line_offset)
             self._validate_link_target(
                 file_path,
@@ -417,7 +630,7 @@ class BaseValidator(ABC):
             )
             consumed_at_indices.add(match.start())
 
-        for match in suspicious_at_pattern.finditer(masked):
+        for match in _SUSPICIOUS_AT_PATTERN.finditer(masked):
             if match.start() in consumed_at_indices:
                 continue
             token = match.group(0)
@@ -437,7 +650,7 @@ class BaseValidator(ABC):
 
         # Read file content
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = _read_component(file_path)
         except FileNotFoundError:
             result.add_error(
                 message=f"File not found: {file_path}",
@@ -467,6 +680,28 @@ class BaseValidator(ABC):
 
         return result
 
+    def validate_many(
+        self,
+        file_paths: Iterable[Path],
+        max_workers: Optional[int] = None
+    ) -> List[ValidationResult]:
+        """Validate several files with this validator, preserving input order.
+
+        Files run on a thread pool so disk reads, directory listings and
+        external URL checks overlap. Each call builds its own result, and the
+        shared caches tolerate concurrent use. Use this when every file is
+        known to belong to this validator; for large mixed batches use
+        ValidatorFactory.validate_many, which also picks the validator per
+        file and runs on processes.
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) < 2:
+            return [self.validate(file_path) for file_path in file_paths]
+
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.validate, file_paths))
+
     def _parse_frontmatter(
         self,
         content: str,
@@ -482,9 +717,11 @@ class BaseValidator(ABC):
             )
             return None
 
-        # Find the closing delimiter (blank line after --- is optional)
-        end_match = re.search(r"\n---\s*\n?", content[3:])
-        if not end_match:
+        # Find the closing delimiter (blank line after --- is optional). The
+        # first "\n---" after the opening one always closes the block, so a
+        # literal find is enough and avoids copying content[3:].
+        end = content.find("\n---", 3)
+        if end == -1:
             result.add_error(
                 message="Unclosed YAML frontmatter",
                 line_number=1,
@@ -493,7 +730,7 @@ class BaseValidator(ABC):
             return None
 
         # Extract YAML content
-        yaml_content = content[3:end_match.start() + 3]
+        yaml_content = content[3:end]
 
         # Run enhanced YAML validation BEFORE parsing
         yaml_issues = self._validate_yaml_syntax_enhanced(yaml_content, result)
@@ -501,7 +738,7 @@ class BaseValidator(ABC):
             return None  # Critical YAML syntax errors found
 
         try:
-            frontmatter = yaml.safe_load(yaml_content)
+            frontmatter = _load_yaml(yaml_content)
             if frontmatter is None:
                 frontmatter = {}
             if not isinstance(frontmatter, dict):
@@ -526,24 +763,33 @@ class BaseValidator(ABC):
 
         Returns True if critical issues found (parsing should stop).
         """
+        # Every heuristic below needs a closing parenthesis or a quote somewhere
+        # in the block; most frontmatter has neither, so skip the per-line pass
+        has_paren = ')' in yaml_content
+        if not has_paren and '"' not in yaml_content and "'" not in yaml_content:
+            return False
+
         issues_found = False
         lines = yaml_content.split('\n')
+        # Bound once; the loop body runs for every frontmatter line
+        paren_key_search = _YAML_PAREN_KEY_PATTERN.search
+        numbered_paren_search = _YAML_NUMBERED_PAREN_PATTERN.search
 
         for line_num, line in enumerate(lines, start=1):
             stripped = line.strip()
 
             # Skip empty lines and comments
-            if not stripped or stripped.startswith('#'):
+            if not stripped or stripped[0] == '#':
                 continue
 
             # Skip lines that are clearly keys (ending with colon)
-            if stripped.endswith(':'):
+            if stripped[-1] == ':':
                 continue
 
             # Check for unquoted strings with problematic patterns
             # Pattern 1: String containing (N): where N is a number - common YAML error
             # e.g., "including: (1) one, (2) two" - the (2): is interpreted as a key
-            unquoted_match = re.search(r'\([^)]+\):', stripped)
+            unquoted_match = has_paren and '):' in stripped and paren_key_search(stripped)
             if unquoted_match:
                 # Check if this line is NOT part of a quoted string continuation
                 # by counting quotes before the match
@@ -575,9 +821,9 @@ class BaseValidator(ABC):
 
             # Pattern 3: Double-quoted strings with ): patterns - suggest single quotes
             # Some YAML parsers (like Codex) may have issues with "..." containing (N):
-            if '"' in stripped:
+            if has_paren and '"' in stripped:
                 # Check for ): pattern anywhere in the line
-                if re.search(r'\):', stripped) or re.search(r'\([0-9]+\)', stripped):
+                if '):' in stripped or numbered_paren_search(stripped):
                     if stripped.count('"') >= 2:
                         result.add_warning(
                             message="Double-quoted string contains '):' pattern which may cause issues with some YAML parsers",
@@ -656,7 +902,7 @@ class BaseValidator(ABC):
             result.add_error(
                 message=f"Name too long: {len(name)} characters (max {MAX_NAME_LENGTH})",
                 field_name="name",
-                suggestion=f"Shorten name to {MAX_NAME_LENGTH} characters or less"
+                suggestion=_SUG_SHORTEN_NAME
             )
 
         # Check kebab-case format
@@ -672,7 +918,7 @@ class BaseValidator(ABC):
             result.add_error(
                 message=f"Reserved word used as name: '{name}'",
                 field_name="name",
-                suggestion=f"Choose a different name (reserved: {', '.join(sorted(RESERVED_WORDS)[:5])}...)"
+                suggestion=_SUG_RESERVED_NAME
             )
 
     def _validate_description(self, description: Any, result: ValidationResult) -> None:
@@ -690,13 +936,13 @@ class BaseValidator(ABC):
             result.add_warning(
                 message=f"Description too long: {len(description)} characters (max {MAX_DESCRIPTION_LENGTH})",
                 field_name="description",
-                suggestion=f"Shorten description to {MAX_DESCRIPTION_LENGTH} characters"
+                suggestion=_SUG_SHORTEN_DESCRIPTION
             )
 
-        # Check for WHAT and WHEN content
+        # Check for WHAT and WHEN content (one regex pass per keyword set)
         desc_lower = description.lower()
-        has_what = any(kw in desc_lower for kw in WHAT_KEYWORDS)
-        has_when = any(kw in desc_lower for kw in WHEN_KEYWORDS)
+        has_what = _WHAT_KEYWORD_PATTERN.search(desc_lower) is not None
+        has_when = _WHEN_KEYWORD_PATTERN.search(desc_lower) is not None
 
         if not (has_what and has_when):
             missing = []
@@ -725,7 +971,7 @@ class BaseValidator(ABC):
             result.add_error(
                 message=f"Compatibility too long: {len(compatibility)} characters (max {MAX_COMPATIBILITY_LENGTH})",
                 field_name="compatibility",
-                suggestion=f"Shorten compatibility to {MAX_COMPATIBILITY_LENGTH} characters or less"
+                suggestion=_SUG_SHORTEN_COMPATIBILITY
             )
 
     def _validate_tools_field(
@@ -735,10 +981,11 @@ class BaseValidator(ABC):
         result: ValidationResult
     ) -> None:
         """Validate tool names (shared implementation for all validators)."""
+        # Handle tools with arguments like "Bash(git add:*, git status:*)"
         if isinstance(tools, str):
-            tool_list = [t.strip() for t in tools.split(",")]
+            base_tools = _TOOL_NAME_PATTERN.findall(tools)
         elif isinstance(tools, list):
-            tool_list = tools
+            base_tools = [tool.partition("(")[0].strip() for tool in tools if isinstance(tool, str)]
         else:
             result.add_warning(
                 message=f"{field_name} should be a string or list, got {type(tools).__name__}",
@@ -747,16 +994,12 @@ class BaseValidator(ABC):
             )
             return
 
-        for tool in tool_list:
-            if not isinstance(tool, str):
-                continue
-            # Handle tools with arguments like "Bash(git add:*, git status:*)"
-            base_tool = tool.split("(")[0].strip()
+        for base_tool in base_tools:
             if base_tool and base_tool not in VALID_TOOLS:
                 result.add_warning(
                     message=f"Unknown tool: '{base_tool}'",
                     field_name=field_name,
-                    suggestion=f"Valid tools: {', '.join(sorted(VALID_TOOLS)[:5])}..."
+                    suggestion=_SUG_VALID_TOOLS
                 )
 
     def _validate_model_field(
@@ -778,7 +1021,7 @@ class BaseValidator(ABC):
             result.add_warning(
                 message=f"{field_name} should be a string, got {type(model).__name__}",
                 field_name=field_name,
-                suggestion=f"Use one of: {', '.join(sorted(VALID_MODELS))}"
+                suggestion=_SUG_VALID_MODELS
             )
             return
 
@@ -790,7 +1033,7 @@ class BaseValidator(ABC):
             result.add_warning(
                 message=f"Invalid model value: '{model}'",
                 field_name=field_name,
-                suggestion=f"Use one of: {', '.join(sorted(VALID_MODELS))}"
+                suggestion=_SUG_VALID_MODELS
             )
 
     @abstractmethod
@@ -808,6 +1051,9 @@ class BaseValidator(ABC):
 class SkillValidator(BaseValidator):
     """Validator for Claude Code Skills."""
 
+    SECTION_RULES = _SKILL_SECTIONS
+    REQUIRED_SECTION_SUGGESTION = "Add '## {0}' section to SKILL.md"
+
     @property
     def component_type(self) -> str:
         return "skill"
@@ -854,11 +1100,14 @@ class SkillValidator(BaseValidator):
         # Validate I/O examples
         self._validate_io_examples(content, result)
 
+        # List the skill directory once for both layout checks
+        skill_entries = self._list_skill_dir(file_path.parent)
+
         # Check for prohibited files in skill directory
-        self._check_prohibited_files(file_path.parent, result)
+        self._check_prohibited_files(skill_entries, result)
 
         # Validate directory structure (Anthropic convention)
-        self._validate_directory_structure(file_path.parent, result)
+        self._validate_directory_structure(skill_entries, result)
 
         # Validate file references are max one level deep
         self._validate_file_references(content, result)
@@ -902,79 +1151,23 @@ class SkillValidator(BaseValidator):
                 suggestion="Move detailed content to separate files in references/"
             )
 
-    def _validate_markdown_structure(
-        self,
-        content: str,
-        result: ValidationResult
-    ) -> None:
-        """Validate markdown sections are present."""
-        # Find content after frontmatter
-        match = re.search(r"\n---\s*\n", content)
-        if not match:
-            return  # Already caught by frontmatter validation
-
-        body = content[match.end():]
-
-        # Check required sections
-        for section_key, pattern in SKILL_REQUIRED_SECTIONS.items():
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                if section_key == "when_to_use":
-                    section_name = "When to Use"
-                result.add_error(
-                    message=f"Missing required section: '## {section_name}'",
-                    suggestion=f"Add '## {section_name}' section to SKILL.md"
-                )
-
-        # Check recommended sections
-        for section_key in SKILL_RECOMMENDED_SECTIONS:
-            # Convert to hyphenated format for regex matching
-            pattern = SKILL_REQUIRED_SECTIONS.get(section_key)
-            if not pattern:
-                # Create pattern for recommended sections
-                section_name_hyphen = section_key.replace("_", "-")
-                section_name_title = section_name_hyphen.title()
-                if section_name_hyphen == "best-practices":
-                    section_name_title = "Best Practices"
-                elif section_name_hyphen == "constraints-and-warnings":
-                    section_name_title = "Constraints and Warnings"
-                pattern = rf"^#{{1,3}}\s+{section_name_title}"
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                if section_key == "best_practices":
-                    section_name = "Best Practices"
-                elif section_key == "constraints_and_warnings":
-                    section_name = "Constraints and Warnings"
-                result.add_warning(
-                    message=f"Missing recommended section: '## {section_name}'",
-                    suggestion=f"Consider adding '## {section_name}' section"
-                )
-
     def _validate_io_examples(
         self,
         content: str,
         result: ValidationResult
     ) -> None:
         """Validate Input/Output examples format."""
-        # Check for Input/Output pattern in examples (subsections like ### Input, ### Output)
-        io_pattern = re.compile(
-            r"^#{2,3}\s+(?:Input|Output|Example\s+\d+|Example:)",
-            re.MULTILINE | re.IGNORECASE
-        )
-
-        # Also check for code blocks in examples section which indicate I/O
-        code_block_pattern = re.compile(
-            r"```[a-zA-Z0-9]*\n[\s\S]*?\n```",
-            re.MULTILINE
-        )
-
         # Check if Examples section exists first
-        examples_match = re.search(r"^#{1,3}\s+Examples", content, re.IGNORECASE | re.MULTILINE)
+        examples_match = _EXAMPLES_HEADER_PATTERN.search(content)
 
         if examples_match:
-            # If Examples section exists, check for I/O patterns
-            examples_section = content[examples_match.start():]
-            has_io = io_pattern.search(examples_section) or code_block_pattern.search(examples_section)
+            # If Examples section exists, check for Input/Output subsections
+            # (### Input, ### Output) or code blocks, which also indicate I/O
+            start = examples_match.start()
+            has_io = (
+                _IO_SUBSECTION_PATTERN.search(content, start)
+                or _CODE_BLOCK_PATTERN.search(content, start)
+            )
             if not has_io:
                 result.add_warning(
                     message="Missing Input/Output examples in Examples section",
@@ -995,30 +1188,16 @@ class SkillValidator(BaseValidator):
         Invalid: references/subfolder/file.md, ../outside/file.md
         """
         # Find content after frontmatter
-        match = re.search(r"\n---\s*\n", content)
-        if not match:
+        start = _body_start(content)
+        if start is None:
             return
 
-        body = content[match.end():]
-
-        # Pattern 1: Markdown links [text](path)
-        md_link_pattern = re.compile(
-            r'\[([^\]]+)\]\(([^)]+)\)',
-            re.MULTILINE
-        )
-
-        # Pattern 2: Bare file paths (lines referencing files)
-        # Match lines that look like file references
-        bare_path_pattern = re.compile(
-            r'^(?:[\s]*[-*]?[\s]*)?(?:See|Run|Use|Check|Load|Read|Execute)?[\s:]*'
-            r'(scripts/|references/|assets/)(\S+)',
-            re.MULTILINE | re.IGNORECASE
-        )
+        body_start = start[0]
 
         checked_paths = set()
 
-        # Check markdown links
-        for match in md_link_pattern.finditer(body):
+        # Check markdown links [text](path)
+        for match in _FILE_REFERENCE_LINK_PATTERN.finditer(content, body_start):
             path = match.group(2).strip()
             # Skip URLs
             if path.startswith(('http://', 'https://', '#', 'mailto:')):
@@ -1028,8 +1207,8 @@ class SkillValidator(BaseValidator):
                 continue
             self._check_path_depth(path, checked_paths, result)
 
-        # Check bare paths
-        for match in bare_path_pattern.finditer(body):
+        # Check bare paths (lines that look like file references)
+        for match in _BARE_PATH_PATTERN.finditer(content, body_start):
             full_path = match.group(1) + match.group(2)
             self._check_path_depth(full_path, checked_paths, result)
 
@@ -1105,17 +1284,33 @@ class SkillValidator(BaseValidator):
                 suggestion="Use a value between 0 and 10"
             )
 
-    def _check_prohibited_files(self, skill_dir: Path, result: ValidationResult) -> None:
+    def _list_skill_dir(self, skill_dir: Path) -> List[os.DirEntry]:
+        """Return the entries of a skill directory sorted by name (empty if missing)."""
+        # os.scandir() reuses the dirent type, so is_dir() needs no extra stat()
+        try:
+            with os.scandir(skill_dir) as it:
+                return sorted(it, key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def _check_prohibited_files(self, entries: List[os.DirEntry], result: ValidationResult) -> None:
         """Check for prohibited files in the skill directory."""
-        for filename in SKILL_PROHIBITED_FILES:
-            prohibited = skill_dir / filename
-            if prohibited.exists():
-                result.add_error(
-                    message=f"Prohibited file found: {filename}",
-                    suggestion=f"Remove {filename} from skill directory"
-                )
+        # is_file()/is_dir() follow symlinks, so a dangling link is not reported
+        present = (
+            entry.name for entry in entries
+            if entry.name in SKILL_PROHIBITED_FILES and (entry.is_file() or entry.is_dir())
+        )
+        for filename in sorted(present):
+            result.add_error(
+                message=f"Prohibited file found: {filename}",
+                suggestion=f"Remove {filename} from skill directory"
+            )
 
-    def _validate_directory_structure(self, skill_dir: Path, result: ValidationResult) -> None:
+    def _validate_directory_structure(
+        self,
+        entries: List[os.DirEntry],
+        result: ValidationResult
+    ) -> None:
         """Validate skill directory follows the Anthropic convention.
 
         Expected structure:
@@ -1126,10 +1321,7 @@ class SkillValidator(BaseValidator):
                 ├── references/
                 └── assets/
         """
-        if not skill_dir.exists():
-            return
-
-        for entry in sorted(skill_dir.iterdir()):
+        for entry in entries:
             name = entry.name
 
             # SKILL.md is allowed
@@ -1144,7 +1336,7 @@ class SkillValidator(BaseValidator):
                 if name not in SKILL_ALLOWED_SUBDIRS:
                     result.add_error(
                         message=f"Non-standard directory found: '{name}/'",
-                        suggestion=f"Move contents to one of the allowed subdirectories: {', '.join(sorted(SKILL_ALLOWED_SUBDIRS))}/"
+                        suggestion=_SUG_ALLOWED_SUBDIRS
                     )
             else:
                 # Any file other than SKILL.md at root level is not allowed
@@ -1234,9 +1426,9 @@ class SkillMarkdownValidator(BaseValidator):
     def schema(self) -> Dict[str, Set[str]]:
         return {"required": set(), "optional": set()}
 
-    def can_validate(self, file_path: Path) -> bool:
+    def can_validate(self, file_path: Path, path_str: Optional[str] = None) -> bool:
         """Check if this validator can handle a bundled markdown resource."""
-        return file_path.name != "SKILL.md" and bool(self.file_pattern.search(str(file_path)))
+        return file_path.name != "SKILL.md" and bool(self.file_pattern.search(path_str or str(file_path)))
 
     def validate(self, file_path: Path) -> ValidationResult:
         """Validate bundled markdown syntax, links, and filename convention."""
@@ -1246,7 +1438,7 @@ class SkillMarkdownValidator(BaseValidator):
         )
 
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = _read_component(file_path)
         except FileNotFoundError:
             result.add_error(
                 message=f"File not found: {file_path}",
@@ -1285,6 +1477,10 @@ class SkillMarkdownValidator(BaseValidator):
 class AgentValidator(BaseValidator):
     """Validator for Claude Code Agents."""
 
+    SECTION_RULES = _AGENT_SECTIONS
+    REQUIRED_SECTION_MESSAGE = "Missing required section matching: '{0}'"
+    REQUIRED_SECTION_SUGGESTION = "Add a section like '## Role', '## Process', or '## Guidelines' to the agent"
+
     @property
     def component_type(self) -> str:
         return "agent"
@@ -1326,7 +1522,7 @@ class AgentValidator(BaseValidator):
             result.add_warning(
                 message=f"model should be a string, got {type(model).__name__}",
                 field_name="model",
-                suggestion=f"Use one of: {', '.join(sorted(AGENT_VALID_MODELS))}"
+                suggestion=_SUG_AGENT_MODELS
             )
             return
 
@@ -1335,7 +1531,7 @@ class AgentValidator(BaseValidator):
             result.add_warning(
                 message="'inherit' model value is not recommended for agents",
                 field_name="model",
-                suggestion=f"Explicitly specify model for better control: {', '.join(sorted(AGENT_VALID_MODELS))}"
+                suggestion=_SUG_AGENT_EXPLICIT_MODEL
             )
             return
 
@@ -1344,53 +1540,16 @@ class AgentValidator(BaseValidator):
             result.add_warning(
                 message=f"Invalid model value: '{model}'",
                 field_name="model",
-                suggestion=f"Use one of: {', '.join(sorted(AGENT_VALID_MODELS))}"
+                suggestion=_SUG_AGENT_MODELS
             )
 
-    def _validate_markdown_structure(
-        self,
-        content: str,
-        result: ValidationResult
-    ) -> None:
-        """Validate agent markdown sections are present."""
-        # Find content after frontmatter
-        match = re.search(r"\n---\s*\n", content)
-        if not match:
-            return  # Already caught by frontmatter validation
-
-        body = content[match.end():]
-
-        # Check required sections
-        for section_key, pattern in AGENT_REQUIRED_SECTIONS.items():
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                result.add_error(
-                    message=f"Missing required section matching: '{section_name}'",
-                    suggestion=f"Add a section like '## Role', '## Process', or '## Guidelines' to the agent"
-                )
-
-        # Check recommended sections
-        for section_key in AGENT_RECOMMENDED_SECTIONS:
-            section_name_hyphen = section_key.replace("_", "-")
-            section_name_title = section_name_hyphen.title()
-            if section_name_hyphen == "skills-integration":
-                section_name_title = "Skills Integration"
-            elif section_name_hyphen == "common-patterns":
-                section_name_title = "Common Patterns"
-            elif section_name_hyphen == "output-format":
-                section_name_title = "Output Format"
-            pattern = rf"^#{{1,3}}\s+{section_name_title}"
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                result.add_warning(
-                    message=f"Missing recommended section: '## {section_name}'",
-                    suggestion=f"Consider adding '## {section_name}' section"
-                )
-
 
 class CommandValidator(BaseValidator):
     """Validator for Claude Code Slash Commands."""
 
+    SECTION_RULES = _COMMAND_SECTIONS
+    REQUIRED_SECTION_SUGGESTION = "Add '## {0}' section to command file"
+
     @property
     def component_type(self) -> str:
         return "command"
@@ -1436,44 +1595,6 @@ class CommandValidator(BaseValidator):
         self._validate_markdown_structure(content, result)
         self._validate_section_order(content, result)
 
-    def _validate_markdown_structure(
-        self,
-        content: str,
-        result: ValidationResult
-    ) -> None:
-        """Validate command markdown sections are present."""
-        # Find content after frontmatter
-        match = re.search(r"\n---\s*\n", content)
-        if not match:
-            return  # Already caught by frontmatter validation
-
-        body = content[match.end():]
-
-        # Check required sections
-        for section_key, pattern in COMMAND_REQUIRED_SECTIONS.items():
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                result.add_error(
-                    message=f"Missing required section: '## {section_name}'",
-                    suggestion=f"Add '## {section_name}' section to command file"
-                )
-
-        # Check recommended sections
-        for section_key in COMMAND_RECOMMENDED_SECTIONS:
-            section_name_hyphen = section_key.replace("_", "-")
-            section_name_title = section_name_hyphen.title()
-            if section_name_hyphen == "best-practices":
-                section_name_title = "Best Practices"
-            pattern = rf"^#{{1,3}}\s+{section_name_title}"
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                if section_key == "best_practices":
-                    section_name = "Best Practices"
-                result.add_warning(
-                    message=f"Missing recommended section: '## {section_name}'",
-                    suggestion=f"Consider adding '## {section_name}' section"
-                )
-
     def _validate_section_order(
         self,
         content: str,
@@ -1485,78 +1606,56 @@ class CommandValidator(BaseValidator):
         Any section not in the order list can appear after the last defined section.
         """
         # Find content after frontmatter
-        match = re.search(r"\n---\s*\n", content)
-        if not match:
+        start = _body_start(content)
+        if start is None:
             return  # Already caught by frontmatter validation
 
-        body = content[match.end():]
+        body_start = start[0]
 
-        # Map section names to their expected order index
-        section_order_indices: Dict[str, int] = {
-            name: idx for idx, name in enumerate(COMMAND_SECTIONS_ORDER)
-        }
-
-        # Find all ordered sections in the document with their positions
+        # Find all ordered sections in the document with their positions;
+        # finditer yields them in document order
         found_ordered_sections: List[tuple] = []
 
-        for order_key, pattern in COMMAND_SECTION_PATTERNS.items():
-            for match in re.finditer(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_title = match.group(0).strip()
-                section_pos = match.start()
-                order_index = section_order_indices[order_key]
-                found_ordered_sections.append((order_index, section_pos, order_key, section_title))
+        for match in _COMMAND_ORDER_SCANNER.finditer(content, body_start):
+            # Every scanner branch is a named group, so lastgroup is always set
+            order_key = cast(str, match.lastgroup)
+            found_ordered_sections.append(
+                (_COMMAND_ORDER_INDEX[order_key], match.start(), order_key, match.group(0).strip())
+            )
 
-        # Sort by position in document
-        found_ordered_sections.sort(key=lambda x: x[1])
+        # Fewer than two sections cannot be out of order
+        if len(found_ordered_sections) < 2:
+            return
+
+        # Sections that raised the highest order index seen so far, in document
+        # order. Their order indices strictly increase, so the first earlier
+        # section that belongs after a given one is found by bisection rather
+        # than by rescanning everything found so far.
+        record_orders: List[int] = []
+        record_keys: List[str] = []
 
         # Check if sections are in correct order
         last_order_index = -1
-        last_section_key = None
 
-        for order_index, section_pos, section_key, section_title in found_ordered_sections:
+        for order_index, _, section_key, _ in found_ordered_sections:
             if order_index < last_order_index:
-                # This section is out of order
-                expected_before_key = None
-                expected_before_title = None
-
-                # Find which section this should come before
-                for prev_order_index, prev_pos, prev_key, prev_title in found_ordered_sections:
-                    if prev_pos < section_pos and prev_order_index > order_index:
-                        expected_before_key = prev_key
-                        expected_before_title = prev_title.lstrip("#").strip()
-                        break
-
-                # Find which section this should come after
-                expected_after_key = None
-                for order_idx, section_name in enumerate(COMMAND_SECTIONS_ORDER):
-                    if order_idx < order_index:
-                        # Check if this section exists in the document
-                        for prev_order_idx, prev_pos, prev_key, prev_title in found_ordered_sections:
-                            if prev_key == section_name and prev_pos < section_pos:
-                                expected_after_key = section_name
+                # This section is out of order. The section that set
+                # last_order_index is a record above it, so an earlier
+                # section it should come before always exists.
+                expected_before_key = record_keys[bisect_right(record_orders, order_index)]
 
                 current_name = section_key.replace("_", " ").title()
-
-                if expected_before_key:
-                    expected_name = expected_before_key.replace("_", " ").title()
-                    result.add_error(
-                        message=f"Section '## {current_name}' is out of order",
-                        suggestion=f"Move '## {current_name}' before '## {expected_name}' (correct order: Overview → Usage → Arguments → Current Context → Execution Steps → Execution Instructions → Integration with Sub-agents → Examples)"
-                    )
-                elif expected_after_key:
-                    expected_name = expected_after_key.replace("_", " ").title()
-                    result.add_error(
-                        message=f"Section '## {current_name}' is out of order",
-                        suggestion=f"Move '## {current_name}' after '## {expected_name}' (correct order: Overview → Usage → Arguments → Current Context → Execution Steps → Execution Instructions → Integration with Sub-agents → Examples)"
-                    )
-                else:
-                    result.add_error(
-                        message=f"Section '## {current_name}' is out of order",
-                        suggestion=f"Correct order: Overview → Usage → Arguments → Current Context → Execution Steps → Execution Instructions → Integration with Sub-agents → Examples"
-                    )
+                expected_name = expected_before_key.replace("_", " ").title()
+                result.add_error(
+                    message=f"Section '## {current_name}' is out of order",
+                    suggestion=f"Move '## {current_name}' before '## {expected_name}' (correct order: Overview → Usage → Arguments → Current Context → Execution Steps → Execution Instructions → Integration with Sub-agents → Examples)"
+                )
             else:
                 last_order_index = order_index
-                last_section_key = section_key
+
+            if not record_orders or order_index > record_orders[-1]:
+                record_orders.append(order_index)
+                record_keys.append(section_key)
 
     def _validate_boolean(
         self,
@@ -1565,7 +1664,8 @@ class CommandValidator(BaseValidator):
         result: ValidationResult
     ) -> None:
         """Validate boolean field."""
-        if not isinstance(value, bool):
+        # bool cannot be subclassed, so an identity check is exact
+        if value.__class__ is not bool:
             result.add_warning(
                 message=f"{field_name} should be a boolean, got {type(value).__name__}",
                 field_name=field_name,
@@ -1576,6 +1676,9 @@ class CommandValidator(BaseValidator):
 class RuleValidator(BaseValidator):
     """Validator for Claude Code Rules (.claude/rules/ format)."""
 
+    SECTION_RULES = _RULE_SECTIONS
+    REQUIRED_SECTION_SUGGESTION = "Add '## {0}' section to rule file"
+
     @property
     def component_type(self) -> str:
         return "rule"
@@ -1624,7 +1727,7 @@ class RuleValidator(BaseValidator):
         self._validate_rule_filename(file_path, result)
 
         # Validate markdown sections
-        self._validate_rule_sections(content, result)
+        self._validate_markdown_structure(content, result)
 
         # Validate file size
         self._validate_rule_size(content, result)
@@ -1638,7 +1741,7 @@ class RuleValidator(BaseValidator):
                     field_name="globs",
                     suggestion="Provide a glob pattern (e.g., '**/*.java')"
                 )
-            elif not any(c in globs for c in ('*', '?', '{', '[')):
+            elif not ('*' in globs or '?' in globs or '{' in globs or '[' in globs):
                 result.add_warning(
                     message=f"Globs value '{globs}' contains no wildcard characters",
                     field_name="globs",
@@ -1700,38 +1803,6 @@ class RuleValidator(BaseValidator):
                 suggestion="Rename to kebab-case (e.g., 'naming-conventions.md')"
             )
 
-    def _validate_rule_sections(self, content: str, result: ValidationResult) -> None:
-        """Validate required and recommended markdown sections."""
-        match = re.search(r"\n---\s*\n", content)
-        if not match:
-            return
-
-        body = content[match.end():]
-
-        # Check required sections
-        for section_key, pattern in RULE_REQUIRED_SECTIONS.items():
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                result.add_error(
-                    message=f"Missing required section: '## {section_name}'",
-                    suggestion=f"Add '## {section_name}' section to rule file"
-                )
-
-        # Check recommended sections
-        for section_key in RULE_RECOMMENDED_SECTIONS:
-            if section_key == "context":
-                pattern = r"^#{1,3}\s+Context"
-            elif section_key == "examples":
-                pattern = r"^#{1,3}\s+Examples"
-            else:
-                pattern = rf"^#{{1,3}}\s+{section_key.replace('_', ' ').title()}"
-            if not re.search(pattern, body, re.IGNORECASE | re.MULTILINE):
-                section_name = section_key.replace("_", " ").title()
-                result.add_warning(
-                    message=f"Missing recommended section: '## {section_name}'",
-                    suggestion=f"Consider adding '## {section_name}' section"
-                )
-
     def _validate_rule_size(self, content: str, result: ValidationResult) -> None:
         """Validate rule file size."""
         line_count = content.count('\n') + 1
@@ -1762,7 +1833,7 @@ class KebabCaseValidator(BaseValidator):
         # No schema needed for file naming validation
         return {"required": set(), "optional": set()}
 
-    def can_validate(self, file_path: Path) -> bool:
+    def can_validate(self, file_path: Path, path_str: Optional[str] = None) -> bool:
         """Check if this validator can handle the given file."""
         # Only validate .md files
         if not file_path.suffix.lower() == ".md":
@@ -1771,7 +1842,7 @@ class KebabCaseValidator(BaseValidator):
         if file_path.name in KEBAB_CASE_EXEMPT_FILES:
             return False
         # Check pattern
-        return bool(self.file_pattern.search(str(file_path)))
+        return bool(self.file_pattern.search(path_str or str(file_path)))
 
     def validate(self, file_path: Path) -> ValidationResult:
         """Validate that the filename follows kebab-case convention."""
@@ -1797,9 +1868,9 @@ class KebabCaseValidator(BaseValidator):
         # Replace underscores with hyphens
         result = name.replace("_", "-")
         # Replace camelCase with kebab-case
-        result = re.sub(r'([a-z])([A-Z])', r'\1-\2', result).lower()
+        result = _CAMEL_CASE_BOUNDARY_PATTERN.sub(r'\1-\2', result).lower()
         # Replace multiple hyphens with single
-        result = re.sub(r'-+', '-', result)
+        result = _HYPHEN_RUN_PATTERN.sub('-', result)
         # Remove leading/trailing hyphens
         result = result.strip('-')
         return result
@@ -1971,10 +2042,25 @@ class PluginJsonValidator:
     """Validator for plugin.json files - verifies component registration."""
 
     PLUGIN_JSON_PATTERN = re.compile(r"plugin\.json$")
-
-    def can_validate(self, file_path: Path) -> bool:
+    COMPONENT_TYPES = ("skills", "agents", "commands", "rules")
+
+    # Missing-component templates, keyed by component type
+    NOT_FOUND_MESSAGES = {
+        "skills": "Skill not found: '{0}'",
+        "agents": "Agent not found: '{0}'",
+        "commands": "Command not found: '{0}'",
+        "rules": "Rule not found: '{0}'",
+    }
+    NOT_FOUND_SUGGESTIONS = {
+        "skills": "Ensure '{0}/SKILL.md' exists or remove from plugin.json",
+        "agents": "Ensure '{0}' exists or remove from plugin.json",
+        "commands": "Ensure '{0}' exists or remove from plugin.json",
+        "rules": "Ensure '{0}' exists or remove from plugin.json",
+    }
+
+    def can_validate(self, file_path: Path, path_str: Optional[str] = None) -> bool:
         """Check if this validator can handle the given file."""
-        return bool(self.PLUGIN_JSON_PATTERN.search(str(file_path)))
+        return bool(self.PLUGIN_JSON_PATTERN.search(path_str or str(file_path)))
 
     def validate(self, file_path: Path) -> ValidationResult:
         """Validate plugin.json and check component registration."""
@@ -2016,36 +2102,39 @@ class PluginJsonValidator:
         # Get plugin directory
         plugin_dir = file_path.parent.parent
 
-        # Validate each component type
-        self._validate_components(
-            plugin_data, plugin_dir, "skills", result
-        )
-        self._validate_components(
-            plugin_data, plugin_dir, "agents", result
-        )
-        self._validate_components(
-            plugin_data, plugin_dir, "commands", result
-        )
-        self._validate_components(
-            plugin_data, plugin_dir, "rules", result
-        )
+        # One registration check per component type, each writing its own shard
+        shards = [
+            self._check_registration(plugin_data, plugin_dir, component_type, file_path)
+            for component_type in self.COMPONENT_TYPES
+        ]
 
-        # Check for unregistered components
-        self._check_unregistered_components(
-            plugin_data, plugin_dir, "skills", result
-        )
-        self._check_unregistered_components(
-            plugin_data, plugin_dir, "agents", result
-        )
-        self._check_unregistered_components(
-            plugin_data, plugin_dir, "commands", result
-        )
-        self._check_unregistered_components(
-            plugin_data, plugin_dir, "rules", result
-        )
+        # Merge in a fixed order: missing components first, then unregistered
+        for missing, _ in shards:
+            result.add_issues(missing.issues)
+        for _, unregistered in shards:
+            result.add_issues(unregistered.issues)
 
         return result
 
+    def _check_registration(
+        self,
+        plugin_data: dict,
+        plugin_dir: Path,
+        component_type: str,
+        file_path: Path
+    ) -> Tuple[ValidationResult, ValidationResult]:
+        """Run both registration checks for one component type into separate shards."""
+        missing = ValidationResult(file_path=file_path, component_type="plugin.json")
+        unregistered = ValidationResult(file_path=file_path, component_type="plugin.json")
+
+        # Validate that registered components exist
+        self._validate_components(plugin_data, plugin_dir, component_type, missing)
+
+        # Check for unregistered components
+        self._check_unregistered_components(plugin_data, plugin_dir, component_type, unregistered)
+
+        return missing, unregistered
+
     def _validate_components(
         self,
         plugin_data: dict,
@@ -2054,35 +2143,70 @@ class PluginJsonValidator:
         result: ValidationResult
     ) -> None:
         """Validate that registered components exist on filesystem."""
-        components = plugin_data.get(component_type, [])
+        components = plugin_data.get(component_type)
+        if not components:
+            return  # Nothing registered, so nothing to look up on disk
+
+        # A single readdir of the component directory answers existence for
+        # the common './<type>/<name>' layout; nested paths fall back to stat.
+        prefix = f"./{component_type}/"
+        plugin_dir_str = os.fspath(plugin_dir)
+        known = self._scan_component_dir(os.path.join(plugin_dir_str, component_type))
+        not_found_message = self.NOT_FOUND_MESSAGES[component_type]
+        not_found_suggestion = self.NOT_FOUND_SUGGESTIONS[component_type]
+        singular_title = component_type[:-1].title()
 
         for component_path in components:
-            full_path = plugin_dir / component_path
+            name = component_path[len(prefix):] if component_path.startswith(prefix) else ""
+            direct = bool(name) and "/" not in name
+            entry = known.get(name) if direct else None
 
             if component_type == "skills":
                 # Skills point to directories containing SKILL.md
-                skill_md = full_path / "SKILL.md"
-                if not skill_md.exists():
+                if direct:
+                    skill_dir = entry.path if entry is not None else None
+                else:
+                    skill_dir = os.path.join(plugin_dir_str, component_path)
+                exists = skill_dir is not None and self._has_skill_md(skill_dir)
+                if not exists:
                     result.add_error(
-                        message=f"Skill not found: '{component_path}'",
+                        message=not_found_message.format(component_path),
                         field_name=component_type,
-                        suggestion=f"Ensure '{component_path}/SKILL.md' exists or remove from plugin.json"
+                        suggestion=not_found_suggestion.format(component_path)
                     )
             else:
                 # Agents and commands point directly to .md files
-                if not full_path.exists():
+                exists = entry is not None if direct else os.path.exists(
+                    os.path.join(plugin_dir_str, component_path)
+                )
+                if not exists:
                     result.add_error(
-                        message=f"{component_type[:-1].title()} not found: '{component_path}'",
+                        message=not_found_message.format(component_path),
                         field_name=component_type,
-                        suggestion=f"Ensure '{component_path}' exists or remove from plugin.json"
+                        suggestion=not_found_suggestion.format(component_path)
                     )
-                elif not full_path.suffix == ".md":
+                elif not component_path.endswith(".md"):
                     result.add_error(
-                        message=f"{component_type[:-1].title()} must be a .md file: '{component_path}'",
+                        message=f"{singular_title} must be a .md file: '{component_path}'",
                         field_name=component_type,
                         suggestion="Use .md extension for agent/command files"
                     )
 
+    def _scan_component_dir(self, component_dir: str) -> Dict[str, os.DirEntry]:
+        """Return the direct children of a component directory keyed by name."""
+        try:
+            with os.scandir(component_dir) as entries:
+                return {entry.name: entry for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+    @staticmethod
+    def _has_skill_md(skill_dir: str) -> bool:
+        """Return True if a skill directory contains SKILL.md."""
+        # Plain concatenation: skill_dir is always a str here, so the generic
+        # os.path.join() argument handling buys nothing
+        return os.path.exists(skill_dir + os.sep + "SKILL.md")
+
     def _check_unregistered_components(
         self,
         plugin_data: dict,
@@ -2091,35 +2215,52 @@ class PluginJsonValidator:
         result: ValidationResult
     ) -> None:
         """Check for components on filesystem that are not registered in plugin.json."""
-        registered = set(plugin_data.get(component_type, []))
+        # Compare on names relative to './<type>/' so the loop does not format
+        # a path per entry; nested registrations keep their subpath and so
+        # never collide with a top-level directory of the same basename
+        prefix = f"./{component_type}/"
+        registered_names = frozenset(
+            path[len(prefix):]
+            for path in plugin_data.get(component_type, [])
+            if isinstance(path, str) and path.startswith(prefix)
+        )
+
+        singular = component_type[:-1]
 
-        # Get the directory for this component type
-        component_dir = plugin_dir / component_type
-        if not component_dir.exists():
+        # One readdir (no separate exists() probe); DirEntry reuses the dirent
+        # type, avoiding a stat() per entry
+        component_dir = os.path.join(os.fspath(plugin_dir), component_type)
+        entries = self._scan_component_dir(component_dir).values()
+        if not entries:
             return
 
         if component_type == "skills":
             # Skills are directories with SKILL.md
-            for item in component_dir.iterdir():
-                if item.is_dir() and (item / "SKILL.md").exists():
-                    relative_path = f"./{component_type}/{item.name}"
-                    if relative_path not in registered:
-                        result.add_error(
-                            message=f"Unregistered skill: '{item.name}'",
-                            field_name=component_type,
-                            suggestion=f"Add './{component_type}/{item.name}' to plugin.json skills array"
-                        )
+            on_disk = {entry.name: entry.path for entry in entries if entry.is_dir()}
         else:
             # Agents and commands are .md files
-            for item in component_dir.iterdir():
-                if item.is_file() and item.suffix == ".md":
-                    relative_path = f"./{component_type}/{item.name}"
-                    if relative_path not in registered:
-                        result.add_error(
-                            message=f"Unregistered {component_type[:-1]}: '{item.name}'",
-                            field_name=component_type,
-                            suggestion=f"Add './{component_type}/{item.name}' to plugin.json {component_type} array"
-                        )
+            on_disk = {
+                entry.name: entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".md")
+            }
+
+        # Registered entries can never be reported, so only the set difference
+        # is walked (and only those skill directories are probed for SKILL.md)
+        unregistered = sorted(on_disk.keys() - registered_names)
+        if component_type == "skills":
+            unregistered = [name for name in unregistered if self._has_skill_md(on_disk[name])]
+
+        result.add_issues([
+            ValidationIssue(
+                severity=Severity.ERROR,
+                file_path=result.file_path,
+                message=f"Unregistered {singular}: '{name}'",
+                field_name=component_type,
+                suggestion=f"Add '{prefix}{name}' to plugin.json {component_type} array"
+            )
+            for name in unregistered
+        ])
 
     def _validate_schema(
         self,
@@ -2171,7 +2312,7 @@ class PluginJsonValidator:
             result.add_error(
                 message=f"'name' exceeds maximum length of {MAX_NAME_LENGTH} characters",
                 field_name="name",
-                suggestion=f"Shorten 'name' to {MAX_NAME_LENGTH} characters or less"
+                suggestion=_SUG_PLUGIN_SHORTEN_NAME
             )
 
         # Check kebab-case pattern
@@ -2233,7 +2374,7 @@ class PluginJsonValidator:
             result.add_error(
                 message=f"'description' exceeds maximum length of {MAX_DESCRIPTION_LENGTH} characters",
                 field_name="description",
-                suggestion=f"Shorten 'description' to {MAX_DESCRIPTION_LENGTH} characters or less"
+                suggestion=_SUG_PLUGIN_SHORTEN_DESCRIPTION
             )
 
         # Check minimum length
@@ -2241,7 +2382,7 @@ class PluginJsonValidator:
             result.add_warning(
                 message=f"'description' is too short (minimum {MIN_DESCRIPTION_LENGTH} characters)",
                 field_name="description",
-                suggestion=f"Provide a more detailed description (at least {MIN_DESCRIPTION_LENGTH} characters)"
+                suggestion=_SUG_PLUGIN_LONGER_DESCRIPTION
             )
 
     def _validate_author(
@@ -2351,7 +2492,7 @@ class PluginJsonValidator:
             result.add_warning(
                 message=f"'license' '{license_id}' is not a standard SPDX identifier",
                 field_name="license",
-                suggestion=f"Use a standard SPDX license identifier: {', '.join(sorted(VALID_LICENSES)[:5])}..."
+                suggestion=_SUG_LICENSE
             )
 
     def _validate_component_paths(
@@ -2423,7 +2564,6 @@ class PluginJsonValidator:
                         )
 
 
-
 class HookValidator(BaseValidator):
     """Validator for Claude Code plugin hooks.json files."""
 
@@ -2517,7 +2657,7 @@ class HookValidator(BaseValidator):
             result.add_warning(
                 message=f"Unknown hook event: '{event_name}'",
                 field_name="hooks",
-                suggestion=f"Valid events: {', '.join(sorted(VALID_HOOK_EVENTS))}",
+                suggestion=_SUG_HOOK_EVENTS,
             )
 
         if not isinstance(matchers, list):
@@ -2602,7 +2742,7 @@ class HookValidator(BaseValidator):
             result.add_error(
                 message=f'{location} is missing required "type" field',
                 field_name="hooks",
-                suggestion=f'Add "type" field with one of: {", ".join(sorted(VALID_HOOK_TYPES))}',
+                suggestion=_SUG_HOOK_TYPE_MISSING,
             )
             return
 
@@ -2610,7 +2750,7 @@ class HookValidator(BaseValidator):
             result.add_error(
                 message=f"{location}.type must be a string, got {type(hook_type).__name__}",
                 field_name="hooks",
-                suggestion=f'Set "type" to one of: {", ".join(sorted(VALID_HOOK_TYPES))}',
+                suggestion=_SUG_HOOK_TYPE_SET,
             )
             return
 
@@ -2618,7 +2758,7 @@ class HookValidator(BaseValidator):
             result.add_error(
                 message=f"{location}.type has unknown value: '{hook_type}'",
                 field_name="hooks",
-                suggestion=f'Valid types are: {", ".join(sorted(VALID_HOOK_TYPES))}',
+                suggestion=_SUG_HOOK_TYPE_VALID,
             )
 
         if hook_type == "command":
@@ -2718,9 +2858,19 @@ class HookValidator(BaseValidator):
 class ValidatorFactory:
     """Factory for creating appropriate validators."""
 
+    # Validators are stateless per file, so one set is built per configuration
+    _validators_cache: Dict[bool, Tuple[Any, ...]] = {}
+    _patterns_cache: Optional[List[re.Pattern]] = None
+    _combined_pattern_cache: Optional[re.Pattern] = None
+    _dispatch_cache: Dict[bool, re.Pattern] = {}
+    _suffixes_cache: Dict[bool, Optional[Tuple[str, ...]]] = {}
+
+    # Literal file extension a pattern is anchored on, e.g. r"...\.md$" -> ".md"
+    _ANCHORED_SUFFIX_PATTERN = re.compile(r"\\(\.[A-Za-z0-9]+)\$$")
+
     @classmethod
-    def _build_validators(cls, validate_external_urls: bool = False) -> List[Any]:
-        return [
+    def _build_validators(cls, validate_external_urls: bool = False) -> Tuple[Any, ...]:
+        return (
             SkillValidator(validate_external_urls=validate_external_urls),
             SkillMarkdownValidator(validate_external_urls=validate_external_urls),
             AgentValidator(),
@@ -2731,7 +2881,86 @@ class ValidatorFactory:
             SkillPackageValidator(),
             PluginVersionValidator(),
             PluginJsonValidator(),
-        ]
+        )
+
+    @classmethod
+    def _get_validators(cls, validate_external_urls: bool = False) -> Tuple[Any, ...]:
+        """Return the cached validators for the given configuration."""
+        validators = cls._validators_cache.get(validate_external_urls)
+        if validators is None:
+            validators = cls._build_validators(validate_external_urls=validate_external_urls)
+            cls._validators_cache[validate_external_urls] = validators
+        return validators
+
+    @classmethod
+    def _get_dispatch_pattern(cls, validate_external_urls: bool = False) -> re.Pattern:
+        """Return one alternation of all validator patterns, in priority order.
+
+        Branch ``v<N>`` wraps the pattern of the N-th validator. Each branch is
+        prefixed with a lazy wildcard (and suffixed with one unless the pattern
+        is already ``$``-anchored) so ``fullmatch()`` keeps ``search()``
+        semantics, and alternation order guarantees the first matching
+        validator wins.
+        """
+        dispatch = cls._dispatch_cache.get(validate_external_urls)
+        if dispatch is None:
+            branches = []
+            for index, validator in enumerate(cls._get_validators(validate_external_urls)):
+                pattern = getattr(validator, "file_pattern", None) or validator.PLUGIN_JSON_PATTERN
+                tail = "" if pattern.pattern.endswith("$") else "(?s:.*)"
+                branches.append(f"(?P<v{index}>(?s:.*?)(?:{pattern.pattern}){tail})")
+            dispatch = re.compile("|".join(branches))
+            cls._dispatch_cache[validate_external_urls] = dispatch
+        return dispatch
+
+    @classmethod
+    def _get_candidate_suffixes(cls, validate_external_urls: bool = False) -> Optional[Tuple[str, ...]]:
+        """Return the file extensions any validator can accept, or None if unknown.
+
+        Derived from the validator patterns so it cannot drift from them; if any
+        pattern is not anchored on a literal extension the pre-filter is disabled.
+        """
+        if validate_external_urls not in cls._suffixes_cache:
+            suffixes: Set[str] = set()
+            for validator in cls._get_validators(validate_external_urls):
+                pattern = getattr(validator, "file_pattern", None) or validator.PLUGIN_JSON_PATTERN
+                anchored = cls._ANCHORED_SUFFIX_PATTERN.search(pattern.pattern)
+                if anchored is None:
+                    suffixes = set()
+                    break
+                suffixes.add(anchored.group(1))
+            cls._suffixes_cache[validate_external_urls] = tuple(sorted(suffixes)) or None
+        return cls._suffixes_cache[validate_external_urls]
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _get_validator_index(cls, file_path: Path, validate_external_urls: bool) -> Optional[int]:
+        """Return the index of the validator for a file, memoized per path.
+
+        The CLI resolves each file several times (filtering, --type, validation)
+        and can_validate() only looks at the path, so the answer is stable.
+        """
+        path = str(file_path)
+
+        # Most files in a tree (scripts, assets, configs) are rejected by a
+        # plain suffix compare before the combined regex is run
+        suffixes = cls._get_candidate_suffixes(validate_external_urls)
+        if suffixes is not None and not path.endswith(suffixes):
+            return None
+
+        match = cls._get_dispatch_pattern(validate_external_urls).fullmatch(path)
+        if match is None:
+            return None
+
+        # Validators before the matched branch cannot accept the file; the ones
+        # after it still need can_validate() for their extra (non-regex) checks.
+        validators = cls._get_validators(validate_external_urls=validate_external_urls)
+        # The matched v<N> branch closes last, so lastgroup is always set
+        first = int(cast(str, match.lastgroup)[1:])
+        for index in range(first, len(validators)):
+            if validators[index].can_validate(file_path, path):
+                return index
+        return None
 
     @classmethod
     def get_validator(
@@ -2740,12 +2969,67 @@ class ValidatorFactory:
         validate_external_urls: bool = False
     ) -> Optional[Any]:
         """Get the appropriate validator for a file."""
-        for validator in cls._build_validators(validate_external_urls=validate_external_urls):
-            if validator.can_validate(file_path):
-                return validator
-        return None
+        index = cls._get_validator_index(file_path, validate_external_urls)
+        if index is None:
+            return None
+        return cls._get_validators(validate_external_urls=validate_external_urls)[index]
+
+    @classmethod
+    def validate_many(
+        cls,
+        paths: Iterable[Path],
+        validate_external_urls: bool = False,
+        workers: Optional[int] = None
+    ) -> List[Optional[ValidationResult]]:
+        """Validate many files across worker processes, preserving input order.
+
+        YAML parsing and regex scanning are CPU-bound and independent per file,
+        so a process pool sidesteps the GIL. Entries are None for files no
+        validator handles. Small batches (or workers=1) run in-process. This is
+        opt-in for large batches: the CLI validates sequentially, since hook
+        runs are small and process startup would outweigh the work.
+        BaseValidator.validate_many covers files known to share one validator.
+        """
+        paths = list(paths)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(paths) < 2:
+            return [_validate_one(path, validate_external_urls) for path in paths]
+
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _validate_one,
+                paths,
+                [validate_external_urls] * len(paths),
+                chunksize=chunksize,
+            ))
 
     @classmethod
     def get_all_patterns(cls) -> List[re.Pattern]:
         """Get all file patterns for component files."""
-        return [v.file_pattern for v in cls._build_validators() if hasattr(v, 'file_pattern')]
+        if cls._patterns_cache is None:
+            cls._patterns_cache = [
+                v.file_pattern for v in cls._get_validators() if hasattr(v, 'file_pattern')
+            ]
+        return list(cls._patterns_cache)
+
+    @classmethod
+    def matches_any(cls, path: str) -> bool:
+        """Return True if any component file pattern matches the path.
+
+        One alternation of all patterns, so directory walkers can pre-filter
+        paths with a single regex test before calling get_validator().
+        """
+        if cls._combined_pattern_cache is None:
+            cls._combined_pattern_cache = re.compile(
+                "|".join(f"(?:{pattern.pattern})" for pattern in cls.get_all_patterns())
+            )
+        return cls._combined_pattern_cache.search(path) is not None
+
+
+def _validate_one(file_path: Path, validate_external_urls: bool = False) -> Optional[ValidationResult]:
+    """Validate a single file (module-level so worker processes can pickle it)."""
+    validator = ValidatorFactory.get_validator(file_path, validate_external_urls=validate_external_urls)
+    if validator is None:
+        return None
+    return cast(ValidationResult, validator.validate(file_path))
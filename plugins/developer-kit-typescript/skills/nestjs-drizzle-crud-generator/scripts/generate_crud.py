@@ -14,28 +14,40 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+SNAKE_CASE_BOUNDARY_PATTERN = re.compile(r'(?<!^)(?=[A-Z])')
 
+# Mock literals per field type; other types fall back to a quoted string
+MOCK_VALUES = {'boolean': 'true', 'number': '1', 'integer': '1', 'date': 'new Date()'}
+UPDATE_MOCK_VALUES = {'boolean': 'true', 'number': '1', 'integer': '1'}
+
+
+@lru_cache(maxsize=256)
 def to_camel_case(text: str) -> str:
     """Convert to camelCase"""
     components = text.replace('-', '_').split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
+@lru_cache(maxsize=256)
 def to_pascal_case(text: str) -> str:
     """Convert to PascalCase"""
     return ''.join(x.title() for x in text.replace('-', '_').split('_'))
 
 
+@lru_cache(maxsize=256)
 def to_snake_case(text: str) -> str:
     """Convert to snake_case"""
-    return re.sub(r'(?<!^)(?=[A-Z])', '_', text).lower()
+    return SNAKE_CASE_BOUNDARY_PATTERN.sub('_', text).lower()
 
 
+@lru_cache(maxsize=None)
 def read_template(template_name: str) -> str:
-    """Read template file from assets/templates directory"""
+    """Read template file from assets/templates directory (once per process)"""
     script_dir = Path(__file__).parent.parent
     template_path = script_dir / 'assets' / 'templates' / template_name
 
@@ -75,185 +87,162 @@ def map_field_type_to_zod(field_type: str) -> str:
     return type_mapping.get(field_type, 'z.string()')
 
 
-def generate_table_fields(fields: list[dict]) -> str:
-    """Generate table field definitions"""
-    lines = []
-    for field in fields:
-        name = field['name']
-        field_type = field.get('type', 'string')
-        required = field.get('required', False)
-        default = field.get('default')
-
-        drizzle_type = map_field_type_to_drizzle(field_type)
-
-        if field_type == 'uuid':
-            line = f"  {name}: {drizzle_type}('{name}').primaryKey().defaultRandom()"
-        elif field_type == 'boolean':
-            line = f"  {name}: {drizzle_type}('{name}')"
-            if default is not None:
-                line += f".default({default})"
-            elif required:
-                line += ".notNull()"
-        elif field_type == 'number' or field_type == 'integer':
-            line = f"  {name}: {drizzle_type}('{name}')"
-            if default is not None:
-                line += f".default({default})"
-            elif required:
-                line += ".notNull()"
-        else:
-            line = f"  {name}: {drizzle_type}('{name}')"
-            if default:
-                line += f".default('{default}')"
-            elif required:
-                line += ".notNull()"
-
-        lines.append(line)
-
-    if not lines:
-        return ''
-
-    # Add comma to all lines except the last one
-    lines_with_commas = [line + ',' for line in lines[:-1]]
-    if lines:
-        lines_with_commas.append(lines[-1])
-
-    return '\n'.join(lines_with_commas)
+def _table_field_line(field: dict) -> str:
+    """Build one table column definition"""
+    name = field['name']
+    field_type = field.get('type', 'string')
+    required = field.get('required', False)
+    default = field.get('default')
 
+    parts = [f"  {name}: {map_field_type_to_drizzle(field_type)}('{name}')"]
 
-def generate_create_fields(fields: list[dict]) -> str:
-    """Generate create schema fields"""
-    lines = []
-    for field in fields:
-        name = field['name']
-        field_type = field.get('type', 'string')
-        required = field.get('required', False)
-        max_length = field.get('maxLength')
-        min_length = field.get('minLength')
+    if field_type == 'uuid':
+        parts.append(".primaryKey().defaultRandom()")
+    elif field_type in ('boolean', 'number', 'integer'):
+        if default is not None:
+            parts.append(f".default({default})")
+        elif required:
+            parts.append(".notNull()")
+    else:
+        if default:
+            parts.append(f".default('{default}')")
+        elif required:
+            parts.append(".notNull()")
+
+    return ''.join(parts)
+
+
+def _create_field_line(field: dict) -> str:
+    """Build one create schema field"""
+    name = field['name']
+    required = field.get('required', False)
+    max_length = field.get('maxLength')
+    min_length = field.get('minLength')
+
+    # Build chain
+    parts = [f"  {name}: ", map_field_type_to_zod(field.get('type', 'string'))]
+    if min_length:
+        parts.append(f".min({min_length})")
+    if max_length:
+        parts.append(f".max({max_length})")
+    if not required:
+        parts.append(".optional()")
+
+    return ''.join(parts)
 
-        zod_type = map_field_type_to_zod(field_type)
 
-        # Build chain
-        if not required:
-            zod_type = zod_type.replace('z.', 'z.')
+def _filter_field_line(field: dict) -> str:
+    """Build one filter query field"""
+    return f"  {field['name']}: z.{map_field_type_to_zod(field.get('type', 'string')).replace('z.', '')}"
 
-        chain = zod_type
-        if min_length:
-            chain += f".min({min_length})"
-        if max_length:
-            chain += f".max({max_length})"
-        if not required:
-            chain += ".optional()"
 
-        lines.append(f"  {name}: {chain}")
+def _mock_value_line(field: dict, values: dict[str, str], fallback_prefix: str) -> str:
+    """Build one mock field line from a type -> literal table"""
+    name = field['name']
+    value = values.get(field.get('type', 'string'))
+    if value is None:
+        value = f"'{fallback_prefix}_{name}'"
+    return f"    {name}: {value},"
+
+
+def _mock_field_line(field: dict) -> str:
+    """Build one mock field for tests"""
+    return _mock_value_line(field, MOCK_VALUES, 'test')
+
+
+def _update_dto_line(field: dict) -> str:
+    """Build one update DTO mock field for tests"""
+    return _mock_value_line(field, UPDATE_MOCK_VALUES, 'updated')
+
+
+def _relation_field_line(field: dict) -> Optional[str]:
+    """Build one relation field, or None if the field has no relation"""
+    if field.get('relation') != 'hasMany':
+        return None
+    related = to_pascal_case(field.get('related', field['name'] + 's'))
+    return f"  {to_camel_case(field['name'])}: many({related}Table),"
+
+
+def _join_relations(lines: list[str]) -> str:
+    """Join relation lines, with a placeholder comment when there are none"""
+    return '\n'.join(lines) if lines else '  // No relations defined'
+
+
+def generate_table_fields(fields: list[dict]) -> str:
+    """Generate table field definitions"""
+    return ',\n'.join(_table_field_line(field) for field in fields)
+
 
-    return ',\n'.join(lines)
+def generate_create_fields(fields: list[dict]) -> str:
+    """Generate create schema fields"""
+    return ',\n'.join(_create_field_line(field) for field in fields)
 
 
 def generate_filter_fields(fields: list[dict]) -> str:
     """Generate filter query fields"""
-    lines = []
-    for field in fields:
-        name = field['name']
-        lines.append(f"  {name}: z.{map_field_type_to_zod(field.get('type', 'string')).replace('z.', '')}")
-
-    return ',\n'.join(lines)
+    return ',\n'.join(_filter_field_line(field) for field in fields)
 
 
 def generate_mock_fields(fields: list[dict]) -> str:
     """Generate mock fields for tests"""
-    lines = []
-    for field in fields:
-        name = field['name']
-        field_type = field.get('type', 'string')
-
-        if field_type == 'boolean':
-            lines.append(f"    {name}: true,")
-        elif field_type == 'number' or field_type == 'integer':
-            lines.append(f"    {name}: 1,")
-        elif field_type == 'date':
-            lines.append(f"    {name}: new Date(),")
-        else:
-            lines.append(f"    {name}: 'test_{name}',")
-
-    return '\n'.join(lines)
+    return '\n'.join(_mock_field_line(field) for field in fields)
 
 
 def generate_create_dto(fields: list[dict]) -> str:
     """Generate create DTO mock for tests"""
-    lines = []
-    for field in fields:
-        name = field['name']
-        field_type = field.get('type', 'string')
-
-        if field_type == 'boolean':
-            lines.append(f"    {name}: true,")
-        elif field_type == 'number' or field_type == 'integer':
-            lines.append(f"    {name}: 1,")
-        elif field_type == 'date':
-            lines.append(f"    {name}: new Date(),")
-        else:
-            lines.append(f"    {name}: 'test_{name}',")
-
-    return '\n'.join(lines)
+    return generate_mock_fields(fields)
 
 
 def generate_update_dto(fields: list[dict]) -> str:
     """Generate update DTO mock for tests (all optional)"""
-    lines = []
-    for field in fields:
-        name = field['name']
-        field_type = field.get('type', 'string')
-
-        if field_type == 'boolean':
-            lines.append(f"    {name}: true,")
-        elif field_type == 'number' or field_type == 'integer':
-            lines.append(f"    {name}: 1,")
-        else:
-            lines.append(f"    {name}: 'updated_{name}',")
-
-    return '\n'.join(lines)
+    return '\n'.join(_update_dto_line(field) for field in fields)
 
 
 def generate_relation_fields(fields: list[dict]) -> str:
     """Generate relation fields for Drizzle"""
-    lines = []
-    for field in fields:
-        if field.get('relation') == 'hasMany':
-            related = to_pascal_case(field.get('related', field['name'] + 's'))
-            lines.append(f"  {to_camel_case(field['name'])}: many({related}Table),")
+    lines = [line for line in map(_relation_field_line, fields) if line is not None]
+    return _join_relations(lines)
 
-    return '\n'.join(lines) if lines else '  // No relations defined'
+
+def _generate_all(fields: list[dict]) -> dict[str, str]:
+    """Generate every field-dependent block in a single pass over the fields"""
+    table, create, filters, mock, update, relations = [], [], [], [], [], []
+    for field in fields:
+        table.append(_table_field_line(field))
+        create.append(_create_field_line(field))
+        filters.append(_filter_field_line(field))
+        mock.append(_mock_field_line(field))
+        update.append(_update_dto_line(field))
+        relation = _relation_field_line(field)
+        if relation is not None:
+            relations.append(relation)
+
+    mock_fields = '\n'.join(mock)
+    return {
+        'TableFields': ',\n'.join(table),
+        'TableFieldsSuffix': ',\n' if fields else '',
+        'CreateFields': ',\n'.join(create),
+        'FilterFields': ',\n'.join(filters),
+        'MockFields': mock_fields,
+        'CreateDtoMock': '{' + mock_fields + '}',
+        'UpdateDtoMock': '{' + '\n'.join(update) + '}',
+        'RelationFields': _join_relations(relations),
+    }
 
 
 def replace_placeholders(template: str, feature_name: str, fields: list[dict]) -> str:
     """Replace all placeholders in template"""
-    pascal_name = to_pascal_case(feature_name)
-    camel_name = to_camel_case(feature_name)
     snake_name = to_snake_case(feature_name)
-    table_name = snake_name + 's'
-
-    result = template
-
-    # Replace FeatureName -> PascalCase
-    result = result.replace('{{FeatureName}}', pascal_name)
 
-    # Replace featureName -> camelCase
-    result = result.replace('{{featureName}}', camel_name)
-
-    # Replace tableName
-    result = result.replace('{{tableName}}', table_name)
-
-    # Generate field-specific content
-    result = result.replace('{{TableFields}}', generate_table_fields(fields))
-    result = result.replace('{{TableFieldsSuffix}}', ',\n' if fields else '')
-    result = result.replace('{{CreateFields}}', generate_create_fields(fields))
-    result = result.replace('{{FilterFields}}', generate_filter_fields(fields))
-    result = result.replace('{{MockFields}}', generate_mock_fields(fields))
-    result = result.replace('{{CreateDtoMock}}', '{' + generate_create_dto(fields) + '}')
-    result = result.replace('{{UpdateDtoMock}}', '{' + generate_update_dto(fields) + '}')
-    result = result.replace('{{RelationFields}}', generate_relation_fields(fields))
+    values = {
+        'FeatureName': to_pascal_case(feature_name),
+        'featureName': to_camel_case(feature_name),
+        'tableName': snake_name + 's',
+        **_generate_all(fields),
+    }
 
-    return result
+    # Substitute every {{placeholder}} in one scan; unknown ones are left as-is
+    return PLACEHOLDER_PATTERN.sub(lambda match: values.get(match.group(1), match.group(0)), template)
 
 
 def create_directory_structure(base_path: str, feature_name: str) -> Path: